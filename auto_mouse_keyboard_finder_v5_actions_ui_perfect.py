@@ -1,15 +1,23 @@
 import os
+import io
 import sys
 import json
 import csv
 import threading
 import time
+import functools
 import queue
+import weakref
+import bisect
+import string
+import zlib
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Callable
 
 import pygame
-from ui_components import Button, TextInput, Slider, Dropdown, lighten_color, darken_color
+import pygame.freetype
+from ui_components import BlitPair, Button, TextInput, Slider, Dropdown, blit_batch, lighten_color, darken_color
 
 try:
     import numpy as np
@@ -26,6 +34,16 @@ try:
 except ImportError:
     pyautogui = None
 
+try:
+    import mss
+except ImportError:
+    mss = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from PIL import ImageGrab, Image
 except ImportError:
@@ -64,6 +82,52 @@ class ActionItem:
         return cls(action_type=action_type, params=params, delay_ms=delay_ms)
 
 
+@dataclass
+class PreparedTargetImage:
+    token: int
+    size: Tuple[int, int]
+    surface: Optional[pygame.Surface] = None
+    preview: Optional[pygame.Surface] = None
+    template: Optional[Tuple[Any, Any, Optional[Any]]] = None
+    error: Optional[Exception] = None
+
+
+class ActionTable:
+    def __init__(self, items: Optional[List[ActionItem]] = None) -> None:
+        self.types: List[str] = []
+        self.params: List[Dict[str, Any]] = []
+        self.delays_ms: List[int] = []
+        for item in items or []:
+            self.append(item)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index: int) -> ActionItem:
+        return ActionItem(action_type=self.types[index], params=self.params[index], delay_ms=self.delays_ms[index])
+
+    def __iter__(self):
+        for action_type, params, delay_ms in self.rows():
+            yield ActionItem(action_type=action_type, params=params, delay_ms=delay_ms)
+
+    def append(self, item: ActionItem) -> None:
+        self.types.append(item.action_type)
+        self.params.append(normalize_action_params(item.params))
+        self.delays_ms.append(item.delay_ms)
+
+    def pop(self, index: int) -> ActionItem:
+        return ActionItem(action_type=self.types.pop(index), params=self.params.pop(index), delay_ms=self.delays_ms.pop(index))
+
+    def rows(self):
+        return zip(self.types, self.params, self.delays_ms)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [
+            {"action_type": action_type, "params": params, "delay_ms": delay_ms}
+            for action_type, params, delay_ms in self.rows()
+        ]
+
+
 ACTION_DEFINITIONS: Dict[str, Dict[str, Any]] = {
     "Move to Match": {
         "requires_position": False,
@@ -124,6 +188,23 @@ ACTION_DEFINITIONS: Dict[str, Dict[str, Any]] = {
 }
 
 DEFAULT_ACTION_DELAY_MS = 1000
+TEXT_CACHE_SIZE = 2048
+PYGAME_DEFAULT_FONT_SCALE = 0.6875
+HOTKEY_EVENT = pygame.USEREVENT
+STATE_CHANGED_EVENT = pygame.USEREVENT + 1
+EVENT_WAIT_TIMEOUT_MS = 16
+IDLE_EVENT_WAIT_TIMEOUT_MS = 100
+MOUSE_POLL_INTERVAL_MS = 50
+MATCH_PYRAMID_FACTOR = 4
+MATCH_PYRAMID_MIN_TEMPLATE = 32
+
+CompiledAction = Callable[[Tuple[int, int], threading.Event], Optional[bool]]
+
+_NAME_TO_KEY: Dict[str, int] = {
+    name.lower(): getattr(pygame, f"K_{name}")
+    for name in [f"F{number}" for number in range(1, 25)] + list(string.ascii_lowercase) + list(string.digits)
+    if hasattr(pygame, f"K_{name}")
+}
 
 
 
@@ -136,7 +217,21 @@ def parse_int(value: str) -> Optional[int]:
         return None
 
 
+def normalize_action_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    if not any(isinstance(params.get(key), str) for key in ("x", "y", "duration_ms")):
+        return params
+    params = dict(params)
+    for key in ("x", "y"):
+        if isinstance(params.get(key), str):
+            params[key] = parse_int(params[key])
+    if isinstance(params.get("duration_ms"), str):
+        params["duration_ms"] = parse_positive_int(params["duration_ms"])
+    return params
+
+
 def parse_positive_int(value: str) -> Optional[int]:
+    if isinstance(value, str) and value.isdecimal():
+        return int(value)
     number = parse_int(value)
     if number is None:
         return None
@@ -145,6 +240,18 @@ def parse_positive_int(value: str) -> Optional[int]:
     return number
 
 
+def dump_json(obj: Any, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def load_json(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def parse_hotkey_sequence(text: str) -> List[str]:
     if not text:
         return []
@@ -152,24 +259,41 @@ def parse_hotkey_sequence(text: str) -> List[str]:
     return [part for part in parts if part]
 
 
-def pil_image_to_surface(pil_img: "Image.Image") -> Optional[pygame.Surface]:
+def sys_freetype_font(name: str, size: int) -> pygame.freetype.Font:
+    path = pygame.font.match_font(name)
+    if path is None:
+        font = pygame.freetype.Font(None, max(1, int(size * PYGAME_DEFAULT_FONT_SCALE)))
+    else:
+        font = pygame.freetype.Font(path, size)
+    font.pad = True
+    return font
+
+
+def convert_for_display(surface: pygame.Surface) -> pygame.Surface:
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def pil_image_to_surface(pil_img: "Image.Image", convert: bool = True) -> Optional[pygame.Surface]:
     if pil_img is None:
         return None
     img = pil_img
     if img.mode not in ("RGB", "RGBA"):
         img = img.convert("RGBA")
-    else:
-        img = img.copy()
     mode = img.mode
     size = img.size
     data = img.tobytes()
     surface = pygame.image.frombuffer(data, size, mode)
-    if mode == "RGBA":
-        return surface.convert_alpha()
-    return surface.convert()
+    return convert_for_display(surface) if convert else surface
 
 
-def scale_surface_to_rect(surface: Optional[pygame.Surface], target_rect: pygame.Rect) -> Optional[pygame.Surface]:
+def scale_surface_to_rect(
+    surface: Optional[pygame.Surface],
+    target_rect: pygame.Rect,
+    quality: str = "smooth",
+    convert: bool = True,
+) -> Optional[pygame.Surface]:
     if surface is None or target_rect.width <= 0 or target_rect.height <= 0:
         return surface
     width, height = surface.get_size()
@@ -179,10 +303,52 @@ def scale_surface_to_rect(surface: Optional[pygame.Surface], target_rect: pygame
     if scale <= 0:
         scale = 1.0
     new_size = (max(1, int(width * scale)), max(1, int(height * scale)))
-    return pygame.transform.smoothscale(surface, new_size)
+    if quality == "fast":
+        scaled = pygame.transform.scale(surface, new_size)
+    else:
+        scaled = pygame.transform.smoothscale(surface, new_size)
+    return convert_for_display(scaled) if convert else scaled
+
+
+def match_peak(result: Any) -> Tuple[float, Tuple[int, int]]:
+    flat = result.ravel()
+    index = int(flat.argmax())
+    row, column = divmod(index, result.shape[1])
+    return float(flat[index]), (column, row)
+
+
+def prepare_template_data(target_cv: Any) -> Tuple[Any, Any, Optional[Any]]:
+    gray = cv2.cvtColor(target_cv, cv2.COLOR_BGR2GRAY)
+    small = None
+    if min(target_cv.shape[:2]) >= MATCH_PYRAMID_MIN_TEMPLATE:
+        scale = 1.0 / MATCH_PYRAMID_FACTOR
+        small = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    return target_cv, gray, small
+
+
+def load_scrap_image() -> Optional["Image.Image"]:
+    if Image is None:
+        return None
+    try:
+        if not pygame.scrap.get_init():
+            return None
+        data = pygame.scrap.get(pygame.SCRAP_BMP)
+    except Exception:
+        return None
+    if not data:
+        return None
+    try:
+        image = Image.open(io.BytesIO(data))
+        image.load()
+    except Exception:
+        return None
+    return image
 
 
 def load_clipboard_image() -> Optional["Image.Image"]:
+    image = load_scrap_image()
+    if image is not None:
+        return image
     if ImageGrab is None:
         return None
     try:
@@ -204,31 +370,69 @@ def load_clipboard_image() -> Optional["Image.Image"]:
     return None
 
 
-def draw_text_wrapped(surface: pygame.Surface, text: str, font: pygame.font.Font, color: Tuple[int, int, int], rect: pygame.Rect, line_height: Optional[int] = None) -> None:
-    if not text:
-        return
+_wrap_fonts: "weakref.WeakValueDictionary[int, pygame.font.Font]" = weakref.WeakValueDictionary()
+_glyph_width_cache: "weakref.WeakKeyDictionary[pygame.font.Font, Dict[str, int]]" = weakref.WeakKeyDictionary()
+
+
+def _glyph_widths(font: pygame.font.Font) -> Dict[str, int]:
+    widths = _glyph_width_cache.get(font)
+    if widths is None:
+        widths = {}
+        for code in range(32, 127):
+            char = chr(code)
+            metrics = font.metrics(char)
+            if metrics and metrics[0]:
+                widths[char] = metrics[0][4]
+            else:
+                widths[char] = font.size(char)[0]
+        _glyph_width_cache[font] = widths
+    return widths
+
+
+def _measure_word(font: pygame.font.Font, widths: Dict[str, int], word: str) -> int:
+    try:
+        return sum(widths[char] for char in word)
+    except KeyError:
+        return font.size(word)[0]
+
+
+def _wrap_lines(text: str, font: pygame.font.Font, max_width: int, max_lines: int = 3) -> List[str]:
     words = text.split()
-    lines: List[str] = []
-    current = ""
-    max_width = rect.width
+    widths = _glyph_widths(font)
+    space = widths[" "]
+    prefix = [0]
     for word in words:
-        test_line = f"{current} {word}".strip()
-        if font.size(test_line)[0] <= max_width:
-            current = test_line
-        else:
-            if current:
-                lines.append(current)
-            current = word
-    if current:
-        lines.append(current)
+        prefix.append(prefix[-1] + _measure_word(font, widths, word) + space)
+    lines: List[str] = []
+    start = 0
+    while start < len(words) and len(lines) < max_lines:
+        end = bisect.bisect_right(prefix, prefix[start] + max_width + space) - 1
+        end = max(end, start + 1)
+        while end > start + 1 and font.size(" ".join(words[start:end]))[0] > max_width:
+            end -= 1
+        while end < len(words) and font.size(" ".join(words[start:end + 1]))[0] <= max_width:
+            end += 1
+        lines.append(" ".join(words[start:end]))
+        start = end
     if not lines:
         lines.append(text)
-    y = rect.y
+    return lines
+
+
+@functools.lru_cache(maxsize=64)
+def _wrap_and_render(text: str, font_id: int, color: Tuple[int, int, int], max_width: int) -> Tuple[pygame.Surface, ...]:
+    font = _wrap_fonts[font_id]
+    return tuple(font.render(line, True, color) for line in _wrap_lines(text, font, max_width))
+
+
+def draw_text_wrapped(surface: pygame.Surface, text: str, font: pygame.font.Font, color: Tuple[int, int, int], rect: pygame.Rect, line_height: Optional[int] = None) -> None:
+    if not text:
+        return
+    _wrap_fonts[id(font)] = font
+    line_surfaces = _wrap_and_render(text, id(font), tuple(color), rect.width)
     lh = line_height or font.get_linesize()
-    for line in lines[:3]:
-        text_surface = font.render(line, True, color)
-        surface.blit(text_surface, (rect.x, y))
-        y += lh
+    for idx, line_surface in enumerate(line_surfaces):
+        surface.blit(line_surface, (rect.x, rect.y + idx * lh))
 
 
 
@@ -245,14 +449,36 @@ class App:
     def __init__(self) -> None:
         pygame.init()
         pygame.font.init()
+        pygame.freetype.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Auto Mouse & Keyboard Finder")
+        try:
+            pygame.scrap.init()
+        except Exception:
+            pass
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([
+            pygame.QUIT,
+            pygame.VIDEOEXPOSE,
+            pygame.KEYDOWN,
+            pygame.KEYUP,
+            pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEBUTTONUP,
+            pygame.MOUSEMOTION,
+            pygame.MOUSEWHEEL,
+            pygame.WINDOWLEAVE,
+            pygame.TEXTINPUT,
+            HOTKEY_EVENT,
+            STATE_CHANGED_EVENT,
+        ])
         self.clock = pygame.time.Clock()
         self.running = True
 
         self.font_small = pygame.font.SysFont("Segoe UI", 16)
         self.font_medium = pygame.font.SysFont("Segoe UI", 20)
         self.font_large = pygame.font.SysFont("Segoe UI", 24)
+        self.ft_small = sys_freetype_font("Segoe UI", 16)
+        self.ft_medium = sys_freetype_font("Segoe UI", 20)
 
         self.bg_color = (18, 23, 35)
         self.panel_color = (28, 33, 50)
@@ -277,9 +503,25 @@ class App:
 
         self.target_image_surface: Optional[pygame.Surface] = None
         self.target_image_preview: Optional[pygame.Surface] = None
+        self._target_preview_key: Optional[Tuple[int, Tuple[int, int]]] = None
         self.target_image_cv = None
+        self.target_image_gray = None
+        self.target_image_small = None
+        self._template_data: Optional[Tuple[Any, Any, Optional[Any]]] = None
+        self._target_image_token = 0
+        self._prepared_images: "queue.Queue[PreparedTargetImage]" = queue.Queue()
         self.action_hint = ACTION_DEFINITIONS["Move to Match"]["description"]
-        self.actions: List[ActionItem] = []
+        self.actions = ActionTable()
+        self._action_labels: List[Tuple[str, str, str]] = []
+        self._action_plan: List[Tuple[str, CompiledAction, float]] = []
+        self._text_cache: "OrderedDict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface]" = OrderedDict()
+        self._base_row_surface: Optional[pygame.Surface] = None
+        self._base_row_region_cache: Optional[Tuple[str, bool]] = None
+        self._table_surface: Optional[pygame.Surface] = None
+        self._table_dirty = True
+        self._table_row_area = pygame.Rect(0, 0, 0, 0)
+        self._table_column_x: List[int] = []
+        self._scrollbar_cache: Dict[Tuple[Any, ...], pygame.Surface] = {}
         self.selected_action_index: Optional[int] = None
         self.action_table_max_visible = 11
         self.action_scroll_offset = 0
@@ -287,33 +529,51 @@ class App:
         self.action_scrollbar_track_rect = None
         self.action_scroll_dragging = False
         self.action_scroll_drag_offset = 0
+        self._pending_wheel_delta = 0
+        self._pending_thumb_y: Optional[int] = None
         self.search_region: Optional[Tuple[int, int, int, int]] = None
         self.region_setting_in_progress = False
+        self._run_button_state: Optional[Tuple[bool, bool]] = None
         self.region_message = "Use Full Screen"
         self.status_message = "Idle"
+        self._status_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
         self.hotkey_scope = "Focused (in app)"
-        self.toggle_hotkey = "f9"
-        self.action_hotkey = "f10"
+        self._set_toggle_hotkey("f9")
+        self._set_action_hotkey("f10")
         self.awaiting_hotkey: Optional[str] = None
         self.global_hotkey_handles: List[Any] = []
-        self.hotkey_queue: "queue.Queue[str]" = queue.Queue()
+        self._hotkey_deque: "deque[str]" = deque()
+        self._hotkey_wake = threading.Event()
+        self._state_wake = threading.Event()
         self.mouse_position = (0, 0)
         self.last_mouse_update = 0.0
+        self.mouse_listener: Optional[Any] = None
+        self._last_global_xy: Optional[Tuple[int, int]] = None
         self.similarity_threshold = 0.8
         self.loop_delay = 0.25
         self.automation_thread: Optional[threading.Thread] = None
+        self._detection_jobs: "queue.SimpleQueue[Optional[Callable[[], None]]]" = queue.SimpleQueue()
+        self._detection_worker: Optional[threading.Thread] = None
+        self._shutdown_event = threading.Event()
         self.stop_event = threading.Event()
+        self._capture_local = threading.local()
         self.automation_running = False
+        self._dirty = True
+        self._dirty_rects: List[pygame.Rect] = []
+        self._last_render_state: Optional[List[Tuple[pygame.Rect, Any]]] = None
 
         if pyautogui is not None:
             pyautogui.FAILSAFE = False
 
         self._build_ui()
         self.update_run_buttons()
+        self.start_mouse_listener()
+        self.register_focused_hotkeys()
 
     def _build_ui(self) -> None:
         self.buttons: List[Button] = []
         self.text_inputs: List[TextInput] = []
+        self._focused_input: Optional[TextInput] = None
 
         toggle_key_rect = pygame.Rect(self.hotkey_panel_rect.x + 130, self.hotkey_panel_rect.y + 62, 140, 36)
         action_key_rect = pygame.Rect(self.hotkey_panel_rect.x + 130, self.hotkey_panel_rect.y + 114, 140, 36)
@@ -370,26 +630,26 @@ class App:
 
         self.action_text_input = TextInput(
             (self.action_panel_rect.x + 20, text_input_y, 260, 36),
-            self.font_small,
+            self.ft_small,
             placeholder="Add Text / Key",
         )
         self.pos_x_input = TextInput(
             (self.action_panel_rect.x + 20, position_row_y, 120, 36),
-            self.font_small,
+            self.ft_small,
             placeholder="X",
             numeric=True,
             allow_negative=True,
         )
         self.pos_y_input = TextInput(
             (self.action_panel_rect.x + 160, position_row_y, 120, 36),
-            self.font_small,
+            self.ft_small,
             placeholder="Y",
             numeric=True,
             allow_negative=True,
         )
         self.delay_input = TextInput(
             (self.action_panel_rect.x + 20, delay_row_y, 180, 36),
-            self.font_small,
+            self.ft_small,
             placeholder="Delay (ms)",
             numeric=True,
         )
@@ -500,27 +760,169 @@ class App:
 
         self.dropdowns = [self.action_dropdown, self.focus_dropdown]
         self.on_action_change(self.action_dropdown.get_selected())
+        for button in self.buttons:
+            button.prerender()
+        self._build_panel_cache()
+
+    def _build_panel_cache(self) -> None:
+        self._panel_cache: Dict[str, pygame.Surface] = {}
+
+        target = self._create_panel_surface(self.target_panel_rect)
+        target.blit(self.font_medium.render("Target Image (Ctrl+V to paste)", True, self.text_primary), (16, 14))
+        image_area = self.target_image_rect.move(-self.target_panel_rect.x, -self.target_panel_rect.y)
+        pygame.draw.rect(target, self.panel_alt_color, image_area, border_radius=12)
+        self._panel_cache["target"] = target.convert_alpha()
+
+        hotkey = self._create_panel_surface(self.hotkey_panel_rect)
+        hotkey.blit(self.font_medium.render("Hotkeys & Status", True, self.text_primary), (16, 14))
+        hotkey.blit(self.font_small.render("Toggle:", True, self.text_secondary), (20, 68))
+        hotkey.blit(self.font_small.render("Action:", True, self.text_secondary), (20, 120))
+        scope_x = self.focus_dropdown.rect.x - 70 - self.hotkey_panel_rect.x
+        hotkey.blit(self.font_small.render("Scope:", True, self.text_secondary), (scope_x, 108))
+        self._panel_cache["hotkey"] = hotkey.convert_alpha()
+
+        for key, rect, title in (
+            ("status", self.status_panel_rect, "Status:"),
+            ("similarity", self.similarity_panel_rect, "Similarity:"),
+            ("mouse", self.mouse_panel_rect, "Mouse Position:"),
+        ):
+            panel = self._create_panel_surface(rect)
+            panel.blit(self.font_small.render(title, True, self.text_secondary), (16, 12))
+            self._panel_cache[key] = panel.convert_alpha()
+
+        action = self._create_panel_surface(self.action_panel_rect)
+        action.blit(self.font_medium.render("Action on Match", True, self.text_primary), (16, 12))
+        panel_y = self.action_panel_rect.y
+        for label, label_y in (
+            ("Action:", self.action_label_y),
+            ("Position:", self.position_label_y),
+            ("Add Text / Key:", self.text_label_y),
+            ("Delay after action:", self.delay_label_y),
+        ):
+            action.blit(self.font_small.render(label, True, self.text_secondary), (20, label_y - panel_y))
+        self._panel_cache["action"] = action.convert_alpha()
+
+        footer_lines = [
+            self.font_small.render(line, True, self.text_secondary)
+            for line in (
+                "Ctrl+V to paste target image (left panel).",
+                "Press 'R' to drag-select search region, or 'F' for full screen.",
+                "Set 'Action on Match' and optional (key/text/offset x,y).",
+                "Set Similarity (80-95% typical)",
+            )
+        ]
+        footer_height = 18 * (len(footer_lines) - 1) + max(line.get_height() for line in footer_lines)
+        footer = pygame.Surface((max(line.get_width() for line in footer_lines), footer_height), pygame.SRCALPHA)
+        for idx, line in enumerate(footer_lines):
+            footer.blit(line, (0, idx * 18))
+        self._panel_cache["footer"] = footer.convert_alpha()
+
+        self._panel_cache["table"] = self._create_table_surface(has_scrollbar=False)
+        self._panel_cache["table_scroll"] = self._create_table_surface(has_scrollbar=True)
+
+        odd_row_color = darken_color(self.panel_alt_color, 0.9)
+        self._row_bg_even = self._create_row_surface(self.panel_alt_color)
+        self._row_bg_odd = self._create_row_surface(odd_row_color)
+        self._row_bg_selected_even = self._create_row_surface(lighten_color(self.panel_alt_color, 1.2))
+        self._row_bg_selected_odd = self._create_row_surface(lighten_color(odd_row_color, 1.2))
+
+    def _create_row_surface(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        surface = pygame.Surface((self.action_table_rect.width, 32))
+        surface.fill(color)
+        return surface.convert()
+
+    def _create_panel_surface(self, rect: pygame.Rect) -> pygame.Surface:
+        surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, self.panel_color, surface.get_rect(), border_radius=16)
+        return surface
+
+    def _create_table_surface(self, has_scrollbar: bool) -> pygame.Surface:
+        table = self.action_table_rect
+        header_height = 40
+        surface = self._create_panel_surface(table)
+        pygame.draw.rect(surface, self.panel_alt_color, (0, 0, table.width, header_height), border_radius=16)
+        pygame.draw.rect(surface, self.panel_color, (0, header_height, table.width, table.height - header_height))
+        column_x = self.table_column_x(has_scrollbar)
+        for idx, header in enumerate(["Step", "Action List", "Position", "Delay"]):
+            header_text = self.font_small.render(header, True, self.text_secondary)
+            surface.blit(header_text, (column_x[idx] - table.x, 12))
+        return surface.convert_alpha()
+
+    def table_column_x(self, has_scrollbar: bool) -> List[int]:
+        table = self.action_table_rect
+        scrollbar_reserved = (10 + 12 * 2) if has_scrollbar else 0
+        return [
+            table.x + 24,
+            table.x + 140,
+            table.x + table.width - 320 - scrollbar_reserved,
+            table.x + table.width - 140 - scrollbar_reserved,
+        ]
 
     def run(self) -> None:
         while self.running:
             self.clock.tick(60)
-            self.handle_events()
-            self.process_hotkey_queue()
+            if self.automation_running:
+                wait_timeout = EVENT_WAIT_TIMEOUT_MS
+            elif self.mouse_listener is None:
+                wait_timeout = MOUSE_POLL_INTERVAL_MS
+            else:
+                wait_timeout = IDLE_EVENT_WAIT_TIMEOUT_MS
+            self.handle_events(pygame.event.wait(wait_timeout))
             self.update()
-            self.draw()
-            pygame.display.flip()
+            if self._dirty:
+                self.draw()
+                pygame.display.flip()
+            elif self._dirty_rects:
+                clip = self._partial_redraw_clip()
+                self.screen.set_clip(clip)
+                self.draw()
+                self.screen.set_clip(None)
+                pygame.display.update(clip)
+            self._dirty = False
+            self._dirty_rects = []
         self.shutdown()
 
+    def _partial_redraw_clip(self) -> pygame.Rect:
+        clip = self._dirty_rects[0].unionall(self._dirty_rects[1:])
+        text_panels = (self.similarity_panel_rect, self.mouse_panel_rect, self.action_panel_rect)
+        grown = True
+        while grown:
+            grown = False
+            for panel in text_panels:
+                if clip.colliderect(panel) and not clip.contains(panel):
+                    clip.union_ip(panel)
+                    grown = True
+        return clip
+
     def shutdown(self) -> None:
         self.stop_automation(wait=True)
         self.unregister_global_hotkeys()
+        self._shutdown_event.set()
+        self._detection_jobs.put(None)
+        if self.mouse_listener is not None:
+            self.mouse_listener.stop()
         pygame.quit()
 
-    def handle_events(self) -> None:
-        for event in pygame.event.get():
+    def handle_events(self, first_event: Optional[pygame.event.Event] = None) -> None:
+        pygame.event.pump()
+        events = pygame.event.get(pump=False)
+        if first_event is not None and first_event.type != pygame.NOEVENT:
+            events.insert(0, first_event)
+        last_index = len(events) - 1
+        for index, event in enumerate(events):
+            if event.type == pygame.MOUSEMOTION and index < last_index and events[index + 1].type == pygame.MOUSEMOTION:
+                continue
             if event.type == pygame.QUIT:
                 self.running = False
                 return
+            if event.type == HOTKEY_EVENT:
+                self.drain_hotkeys()
+                continue
+            if event.type == STATE_CHANGED_EVENT:
+                self._state_wake.clear()
+                continue
+            if event.type == pygame.VIDEOEXPOSE:
+                self._dirty = True
             dropdown_consumed = False
             for dropdown in self.dropdowns:
                 if dropdown.handle_event(event):
@@ -529,74 +931,141 @@ class App:
                 continue
             for button in self.buttons:
                 button.handle_event(event)
-            for input_box in self.text_inputs:
-                input_box.handle_event(event)
+            if event.type == pygame.KEYDOWN:
+                if self._focused_input is not None:
+                    self._focused_input.handle_event(event)
+            else:
+                for input_box in self.text_inputs:
+                    input_box.handle_event(event)
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    self._focused_input = next((box for box in self.text_inputs if box.active), None)
             self.similarity_slider.handle_event(event)
             self.handle_table_event(event)
             if event.type == pygame.KEYDOWN:
                 self.handle_keydown(event)
+        self.apply_pending_table_scroll()
 
     def handle_keydown(self, event: pygame.event.Event) -> None:
-        key_name = pygame.key.name(event.key)
-        mods = pygame.key.get_mods()
         if self.awaiting_hotkey:
             if event.key == pygame.K_ESCAPE:
                 self.awaiting_hotkey = None
                 self.set_status("Hotkey assignment cancelled.")
                 return
-            assigned_key = key_name.lower()
+            assigned_key = pygame.key.name(event.key).lower()
             if self.awaiting_hotkey == "toggle":
-                self.toggle_hotkey = assigned_key
+                self._set_toggle_hotkey(assigned_key, event.key)
                 self.set_status(f"Toggle hotkey set to {assigned_key.upper()}.")
             else:
-                self.action_hotkey = assigned_key
+                self._set_action_hotkey(assigned_key, event.key)
                 self.set_status(f"Action hotkey set to {assigned_key.upper()}.")
             self.awaiting_hotkey = None
             if self.hotkey_scope.startswith("Global"):
                 self.register_global_hotkeys()
+            else:
+                self.register_focused_hotkeys()
+            return
+        if event.key == pygame.K_v and event.mod & pygame.KMOD_CTRL:
+            self.import_image_from_clipboard()
             return
-        if mods & pygame.KMOD_CTRL:
-            if key_name.lower() == "v":
-                self.import_image_from_clipboard()
-                return
         if not self.text_input_active():
-            if key_name.lower() == "r":
+            if event.key == pygame.K_r:
                 self.start_region_selection()
                 return
-            if key_name.lower() == "f":
+            if event.key == pygame.K_f:
                 self.use_full_screen()
                 return
-        if self.hotkey_scope.startswith("Focused") and not self.text_input_active():
-            lowered = key_name.lower()
-            if lowered == self.toggle_hotkey:
+        if self.hotkey_scope.startswith("Focused") and not self.global_hotkey_handles and not self.text_input_active():
+            if event.key == self._toggle_key_const:
                 self.toggle_run_from_hotkey()
-            elif lowered == self.action_hotkey:
+            elif event.key == self._action_key_const:
                 self.trigger_action_hotkey()
 
+    def _set_toggle_hotkey(self, hotkey: str, key_const: Optional[int] = None) -> None:
+        self.toggle_hotkey = hotkey
+        self._toggle_key_const = key_const if key_const is not None else _NAME_TO_KEY.get(hotkey)
+
+    def _set_action_hotkey(self, hotkey: str, key_const: Optional[int] = None) -> None:
+        self.action_hotkey = hotkey
+        self._action_key_const = key_const if key_const is not None else _NAME_TO_KEY.get(hotkey)
+
     def text_input_active(self) -> bool:
-        return any(box.active for box in self.text_inputs)
+        return self._focused_input is not None and self._focused_input.active
 
-    def process_hotkey_queue(self) -> None:
-        while True:
-            try:
-                item = self.hotkey_queue.get_nowait()
-            except queue.Empty:
-                break
-            if item == "toggle":
-                self.toggle_run_from_hotkey()
-            elif item == "action":
-                self.trigger_action_hotkey()
+    def drain_hotkeys(self) -> None:
+        self._hotkey_wake.clear()
+        while self._hotkey_deque:
+            self.handle_hotkey(self._hotkey_deque.popleft())
+
+    def handle_hotkey(self, item: str) -> None:
+        if self.hotkey_scope.startswith("Focused"):
+            if not pygame.key.get_focused() or self.awaiting_hotkey or self.text_input_active():
+                return
+        if item == "toggle":
+            self.toggle_run_from_hotkey()
+        elif item == "action":
+            self.trigger_action_hotkey()
 
     def update(self) -> None:
-        now = time.time()
-        if now - self.last_mouse_update > 0.05:
-            self.last_mouse_update = now
-            self.mouse_position = self.read_mouse_position()
-        self.similarity_threshold = self.similarity_slider.get_value() / 100.0
+        self.apply_prepared_images()
+        self.apply_status_updates()
+        if self._last_global_xy is not None:
+            self.mouse_position = self._last_global_xy
+        else:
+            now = time.time()
+            if now - self.last_mouse_update > MOUSE_POLL_INTERVAL_MS / 1000.0:
+                self.last_mouse_update = now
+                self.mouse_position = self.read_mouse_position()
+        if self.similarity_slider.changed:
+            self.similarity_slider.changed = False
+            self.similarity_threshold = self.similarity_slider.get_value() / 100.0
         self.update_run_buttons()
+        render_state = self._render_state()
+        last_state = self._last_render_state
+        if last_state is None or len(last_state) != len(render_state):
+            self._dirty = True
+        else:
+            for (old_rect, old_value), (new_rect, new_value) in zip(last_state, render_state):
+                if old_value != new_value:
+                    self._dirty_rects.append(old_rect.union(new_rect))
+        self._last_render_state = render_state
+
+    def _render_state(self) -> List[Tuple[pygame.Rect, Any]]:
+        regions = [
+            (self.target_panel_rect, id(self.target_image_preview)),
+            (self.hotkey_panel_rect, (self.awaiting_hotkey, self.toggle_hotkey, self.action_hotkey)),
+            (self.status_panel_rect, self.status_message),
+            (self.similarity_panel_rect, self.similarity_slider.get_value()),
+            (self.mouse_panel_rect, self.mouse_position),
+            (self.action_panel_rect, self.action_hint),
+            (
+                self.action_table_draw_rect(),
+                (
+                    self.selected_action_index,
+                    self.action_scroll_offset,
+                    id(self.actions),
+                    len(self.actions),
+                    self.region_message,
+                ),
+            ),
+        ]
+        regions.extend((button.rect, (button.disabled, button.hovered)) for button in self.buttons)
+        regions.extend((box.rect, (box.text, box.placeholder, box.active, box.disabled)) for box in self.text_inputs)
+        regions.extend((dropdown.get_draw_rect(), (dropdown.selected_index, dropdown.expanded)) for dropdown in self.dropdowns)
+        return regions
 
     def draw(self) -> None:
         self.screen.fill(self.bg_color)
+        blit_batch(
+            self.screen,
+            [
+                (self._panel_cache["target"], self.target_panel_rect.topleft),
+                (self._panel_cache["hotkey"], self.hotkey_panel_rect.topleft),
+                (self._panel_cache["status"], self.status_panel_rect.topleft),
+                (self._panel_cache["similarity"], self.similarity_panel_rect.topleft),
+                (self._panel_cache["mouse"], self.mouse_panel_rect.topleft),
+                (self._panel_cache["action"], self.action_panel_rect.topleft),
+            ],
+        )
         self.draw_target_panel()
         self.draw_hotkey_panel()
         self.draw_status_panel()
@@ -605,99 +1074,71 @@ class App:
         self.draw_action_panel()
         self.draw_action_table()
         self.draw_footer_instructions()
-        for input_box in self.text_inputs:
-            input_box.draw(self.screen)
         self.similarity_slider.draw(self.screen)
-        for button in self.buttons:
-            button.draw(self.screen)
-        for dropdown in self.dropdowns:
-            dropdown.draw(self.screen)
+        clip = self.screen.get_clip()
+        widget_blits = [pair for input_box in self.text_inputs if input_box.rect.colliderect(clip) for pair in input_box.get_blits()]
+        widget_blits.extend(pair for button in self.buttons if button.rect.colliderect(clip) for pair in button.get_blits())
+        widget_blits.extend(pair for dropdown in self.dropdowns if dropdown.get_draw_rect().colliderect(clip) for pair in dropdown.get_blits())
+        blit_batch(self.screen, widget_blits)
 
     def draw_target_panel(self) -> None:
-        panel = self.target_panel_rect
-        pygame.draw.rect(self.screen, self.panel_color, panel, border_radius=16)
-        title = self.font_medium.render("Target Image (Ctrl+V to paste)", True, self.text_primary)
-        self.screen.blit(title, (panel.x + 16, panel.y + 14))
         image_area = self.target_image_rect
-        pygame.draw.rect(self.screen, self.panel_alt_color, image_area, border_radius=12)
         if self.target_image_preview:
             preview_rect = self.target_image_preview.get_rect(center=image_area.center)
             self.screen.blit(self.target_image_preview, preview_rect)
         else:
-            info = self.font_small.render("No image. Use Ctrl+V.", True, self.text_placeholder)
+            info = self._render_cached(self.font_small, "No image. Use Ctrl+V.", self.text_placeholder)
             info_rect = info.get_rect(center=image_area.center)
             self.screen.blit(info, info_rect)
 
     def draw_hotkey_panel(self) -> None:
-        panel = self.hotkey_panel_rect
-        pygame.draw.rect(self.screen, self.panel_color, panel, border_radius=16)
-        title = self.font_medium.render("Hotkeys & Status", True, self.text_primary)
-        self.screen.blit(title, (panel.x + 16, panel.y + 14))
-
-        toggle_label = self.font_small.render("Toggle:", True, self.text_secondary)
-        action_label = self.font_small.render("Action:", True, self.text_secondary)
-        self.screen.blit(toggle_label, (panel.x + 20, panel.y + 68))
-        self.screen.blit(action_label, (panel.x + 20, panel.y + 120))
-
         self.draw_key_box(self.toggle_key_rect, self.toggle_hotkey, highlighted=self.awaiting_hotkey == "toggle")
         self.draw_key_box(self.action_key_rect, self.action_hotkey, highlighted=self.awaiting_hotkey == "action")
 
-        scope_label = self.font_small.render("Scope:", True, self.text_secondary)
-        scope_label_pos = (self.focus_dropdown.rect.x - 70, panel.y + 108)
-        self.screen.blit(scope_label, scope_label_pos)
-
     def draw_status_panel(self) -> None:
         panel = self.status_panel_rect
-        pygame.draw.rect(self.screen, self.panel_color, panel, border_radius=16)
-        title = self.font_small.render("Status:", True, self.text_secondary)
-        self.screen.blit(title, (panel.x + 16, panel.y + 12))
         text_rect = pygame.Rect(panel.x + 16, panel.y + 34, panel.width - 32, panel.height - 40)
         draw_text_wrapped(self.screen, self.status_message, self.font_small, self.text_primary, text_rect)
 
     def draw_similarity_panel(self) -> None:
         panel = self.similarity_panel_rect
-        pygame.draw.rect(self.screen, self.panel_color, panel, border_radius=16)
-        title = self.font_small.render("Similarity:", True, self.text_secondary)
-        self.screen.blit(title, (panel.x + 16, panel.y + 12))
-        value_text = self.font_small.render(f"{self.similarity_slider.get_value()}%", True, self.text_primary)
-        self.screen.blit(value_text, (panel.right - 60, panel.y + 12))
+        if not self.screen.get_clip().colliderect(panel):
+            return
+        self.ft_small.render_to(self.screen, (panel.right - 60, panel.y + 12), f"{self.similarity_slider.get_value()}%", self.text_primary)
 
     def draw_mouse_panel(self) -> None:
         panel = self.mouse_panel_rect
-        pygame.draw.rect(self.screen, self.panel_color, panel, border_radius=16)
-        title = self.font_small.render("Mouse Position:", True, self.text_secondary)
-        self.screen.blit(title, (panel.x + 16, panel.y + 12))
-        pos_text = self.font_medium.render(f"X={self.mouse_position[0]}, Y={self.mouse_position[1]}", True, self.text_primary)
-        self.screen.blit(pos_text, (panel.x + 16, panel.y + 30))
+        if not self.screen.get_clip().colliderect(panel):
+            return
+        self.ft_medium.render_to(self.screen, (panel.x + 16, panel.y + 30), f"X={self.mouse_position[0]}, Y={self.mouse_position[1]}", self.text_primary)
 
     def draw_action_panel(self) -> None:
         panel = self.action_panel_rect
-        pygame.draw.rect(self.screen, self.panel_color, panel, border_radius=16)
-        title = self.font_medium.render("Action on Match", True, self.text_primary)
-        self.screen.blit(title, (panel.x + 16, panel.y + 12))
-
-        action_label = self.font_small.render("Action:", True, self.text_secondary)
-        position_label = self.font_small.render("Position:", True, self.text_secondary)
-        delay_label = self.font_small.render("Delay after action:", True, self.text_secondary)
-        text_label = self.font_small.render("Add Text / Key:", True, self.text_secondary)
-        self.screen.blit(action_label, (panel.x + 20, self.action_label_y))
-        self.screen.blit(position_label, (panel.x + 20, self.position_label_y))
-        self.screen.blit(text_label, (panel.x + 20, self.text_label_y))
-        self.screen.blit(delay_label, (panel.x + 20, self.delay_label_y))
-
+        if not self.screen.get_clip().colliderect(panel):
+            return
         hint_y = self.set_region_button.rect.y - 28
         hint_rect = pygame.Rect(panel.x + 20, hint_y, panel.width - 40, 20)
-        hint_text = self.font_small.render(self.action_hint, True, self.text_secondary)
-        self.screen.blit(hint_text, hint_rect.topleft)
+        self.ft_small.render_to(self.screen, hint_rect.topleft, self.action_hint, self.text_secondary)
 
     def draw_action_table(self) -> None:
+        if self._table_dirty or self._table_surface is None:
+            self._table_surface = self._render_action_table()
+            self._table_dirty = False
+        table_blits = [(self._table_surface, self.action_table_rect.topleft)]
+        table_blits.extend(self._selected_row_blits())
+        self.screen.blits(table_blits, doreturn=False)
+
+    def action_table_draw_rect(self) -> pygame.Rect:
+        table = self.action_table_rect
+        return pygame.Rect(table.x, table.y, table.width, max(table.height, 40 + (self.action_table_max_visible + 1) * 32))
+
+    def invalidate_action_table(self) -> None:
+        self._table_dirty = True
+
+    def _render_action_table(self) -> pygame.Surface:
         table = self.action_table_rect
-        pygame.draw.rect(self.screen, self.panel_color, table, border_radius=16)
         header_height = 40
         row_height = 32
-        header_rect = pygame.Rect(table.x, table.y, table.width, header_height)
-        pygame.draw.rect(self.screen, self.panel_alt_color, header_rect, border_radius=16)
-        headers = ["Step", "Action List", "Position", "Delay"]
 
         total_actions = len(self.actions)
         max_visible_actions = self.action_table_max_visible
@@ -706,90 +1147,126 @@ class App:
         scrollbar_padding = 12
         scrollbar_reserved = (scrollbar_width + scrollbar_padding * 2) if has_scrollbar else 0
 
-        column_x = [
-            table.x + 24,
-            table.x + 140,
-            table.x + table.width - 320 - scrollbar_reserved,
-            table.x + table.width - 140 - scrollbar_reserved,
-        ]
+        column_x = [x - table.x for x in self.table_column_x(has_scrollbar)]
+        surface = pygame.Surface(self.action_table_draw_rect().size, pygame.SRCALPHA)
+        table_blits = [(self._panel_cache["table_scroll" if has_scrollbar else "table"], (0, 0))]
 
-        for idx, header in enumerate(headers):
-            header_text = self.font_small.render(header, True, self.text_secondary)
-            self.screen.blit(header_text, (column_x[idx], table.y + 12))
-
-        data_y = table.y + header_height
+        data_y = header_height
         data_height = table.height - header_height
-        data_background = pygame.Rect(table.x, data_y, table.width, data_height)
-        pygame.draw.rect(self.screen, self.panel_color, data_background)
 
-        base_row_rect = pygame.Rect(table.x, data_y, table.width - scrollbar_reserved, row_height)
-        pygame.draw.rect(self.screen, self.panel_alt_color, base_row_rect)
-        self.screen.blit(self.font_small.render("1", True, self.text_primary), (column_x[0], base_row_rect.y + 8))
-        self.screen.blit(self.font_small.render("if image found", True, self.text_primary), (column_x[1], base_row_rect.y + 8))
-        self.screen.blit(self.font_small.render(self.region_message, True, self.text_primary), (column_x[2], base_row_rect.y + 8))
-        self.screen.blit(self.font_small.render("0 ms", True, self.text_primary), (column_x[3], base_row_rect.y + 8))
+        row_area = pygame.Rect(0, 0, table.width - scrollbar_reserved, row_height)
+        base_row_key = (self.region_message, has_scrollbar)
+        if self._base_row_surface is None or self._base_row_region_cache != base_row_key:
+            self._base_row_surface = self._create_base_row_surface(row_area, column_x)
+            self._base_row_region_cache = base_row_key
+        table_blits.append((self._base_row_surface, (0, data_y)))
 
         max_offset = max(0, total_actions - max_visible_actions)
         if self.action_scroll_offset > max_offset:
             self.action_scroll_offset = max_offset
         if not has_scrollbar:
             self.action_scroll_offset = 0
-            self.action_scrollbar_thumb_rect = None
-            self.action_scrollbar_track_rect = None
             self.action_scroll_dragging = False
-
-        visible_actions = self.actions[self.action_scroll_offset:self.action_scroll_offset + max_visible_actions]
-        for visible_idx, action in enumerate(visible_actions):
-            actual_index = self.action_scroll_offset + visible_idx
-            row_top = data_y + (visible_idx + 1) * row_height
-            row_rect = pygame.Rect(table.x, row_top, table.width - scrollbar_reserved, row_height)
-            color = self.panel_alt_color if actual_index % 2 == 0 else darken_color(self.panel_alt_color, 0.9)
-            if self.selected_action_index == actual_index:
-                color = lighten_color(color, 1.2)
-            pygame.draw.rect(self.screen, color, row_rect)
-            step_number = str(actual_index + 2)
-            action_text = self.format_action_display(action)
-            position_text = self.format_action_position(action)
-            delay_text = self.format_action_delay(action)
-            self.screen.blit(self.font_small.render(step_number, True, self.text_primary), (column_x[0], row_rect.y + 8))
-            self.screen.blit(self.font_small.render(action_text, True, self.text_primary), (column_x[1], row_rect.y + 8))
-            self.screen.blit(self.font_small.render(position_text, True, self.text_primary), (column_x[2], row_rect.y + 8))
-            self.screen.blit(self.font_small.render(delay_text, True, self.text_primary), (column_x[3], row_rect.y + 8))
+        self._table_row_area = row_area
+        self._table_column_x = column_x
+
+        first_index = self.action_scroll_offset
+        last_index = min(total_actions, first_index + max_visible_actions)
+        for actual_index in range(first_index, last_index):
+            row_top = data_y + (actual_index - first_index + 1) * row_height
+            row_background = self._row_bg_even if actual_index % 2 == 0 else self._row_bg_odd
+            table_blits.append((row_background, (0, row_top), row_area))
+            table_blits.extend(self._action_row_cell_blits(actual_index, column_x, row_top))
+        surface.blits(table_blits, doreturn=False)
 
         if has_scrollbar:
             track_rect = pygame.Rect(
-                table.right - scrollbar_padding - scrollbar_width,
+                table.width - scrollbar_padding - scrollbar_width,
                 data_y + scrollbar_padding,
                 scrollbar_width,
                 data_height - scrollbar_padding * 2,
             )
-            pygame.draw.rect(self.screen, darken_color(self.panel_alt_color, 0.6), track_rect, border_radius=4)
             thumb_height = max(24, int(track_rect.height * (max_visible_actions / total_actions)))
             available_pixels = track_rect.height - thumb_height
             thumb_y = track_rect.y
             if available_pixels > 0 and max_offset > 0:
                 thumb_y += int(available_pixels * (self.action_scroll_offset / max_offset))
             thumb_rect = pygame.Rect(track_rect.x, thumb_y, scrollbar_width, thumb_height)
-            pygame.draw.rect(self.screen, self.accent_blue, thumb_rect, border_radius=4)
-            pygame.draw.rect(self.screen, lighten_color(self.accent_blue, 1.2), thumb_rect, width=1, border_radius=4)
-            self.action_scrollbar_track_rect = track_rect
-            self.action_scrollbar_thumb_rect = thumb_rect
+            surface.blits(
+                [
+                    (self._scrollbar_part(track_rect.size, darken_color(self.panel_alt_color, 0.6), None), track_rect.topleft),
+                    (self._scrollbar_part(thumb_rect.size, self.accent_blue, lighten_color(self.accent_blue, 1.2)), thumb_rect.topleft),
+                ],
+                doreturn=False,
+            )
+            self.action_scrollbar_track_rect = track_rect.move(table.topleft)
+            self.action_scrollbar_thumb_rect = thumb_rect.move(table.topleft)
         else:
             self.action_scrollbar_track_rect = None
             self.action_scrollbar_thumb_rect = None
+        return surface.convert_alpha()
 
-    def draw_footer_instructions(self) -> None:
-        lines = [
-            "Ctrl+V to paste target image (left panel).",
-            "Press 'R' to drag-select search region, or 'F' for full screen.",
-            "Set 'Action on Match' and optional (key/text/offset x,y).",
-            "Set Similarity (80-95% typical)",
+    def _scrollbar_part(
+        self,
+        size: Tuple[int, int],
+        fill_color: Tuple[int, int, int],
+        border_color: Optional[Tuple[int, int, int]],
+    ) -> pygame.Surface:
+        key = (size, fill_color, border_color)
+        surface = self._scrollbar_cache.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            local_rect = surface.get_rect()
+            pygame.draw.rect(surface, fill_color, local_rect, border_radius=4)
+            if border_color is not None:
+                pygame.draw.rect(surface, border_color, local_rect, width=1, border_radius=4)
+            surface = surface.convert_alpha()
+            self._scrollbar_cache[key] = surface
+        return surface
+
+    def _selected_row_blits(self) -> List[BlitPair]:
+        index = self.selected_action_index
+        first_index = self.action_scroll_offset
+        if index is None or not first_index <= index < min(len(self.actions), first_index + self.action_table_max_visible):
+            return []
+        table = self.action_table_rect
+        row_top = table.y + 40 + (index - first_index + 1) * 32
+        row_background = self._row_bg_selected_even if index % 2 == 0 else self._row_bg_selected_odd
+        column_x = [x + table.x for x in self._table_column_x]
+        row_blits = [(row_background, (table.x, row_top), self._table_row_area)]
+        row_blits.extend(self._action_row_cell_blits(index, column_x, row_top))
+        return row_blits
+
+    def _action_row_cell_blits(self, index: int, column_x: List[int], row_top: int) -> List[BlitPair]:
+        texts = (str(index + 2),) + self._action_labels[index]
+        return [
+            (self._render_cached(self.font_small, text, self.text_primary), (column_x[column], row_top + 8))
+            for column, text in enumerate(texts)
         ]
+
+    def _create_base_row_surface(self, row_area: pygame.Rect, column_x: List[int]) -> pygame.Surface:
+        surface = pygame.Surface(row_area.size)
+        surface.blit(self._row_bg_even, (0, 0), row_area)
+        for idx, text in enumerate(("1", "if image found", self.region_message, "0 ms")):
+            surface.blit(self.font_small.render(text, True, self.text_primary), (column_x[idx], 8))
+        return surface.convert()
+
+    def _render_cached(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
+
+    def draw_footer_instructions(self) -> None:
         info_x = self.action_table_rect.x + self.action_table_rect.width - (-10)
         info_y = self.action_table_rect.y - (-400)
-        for idx, line in enumerate(lines):
-            text = self.font_small.render(line, True, self.text_secondary)
-            self.screen.blit(text, (info_x, info_y + idx * 18))
+        self.screen.blit(self._panel_cache["footer"], (info_x, info_y))
 
     def draw_key_box(self, rect: pygame.Rect, key_name: str, highlighted: bool = False) -> None:
         base_color = self.panel_alt_color
@@ -799,7 +1276,7 @@ class App:
         border_color = self.accent_blue if highlighted else darken_color(base_color, 0.8)
         pygame.draw.rect(self.screen, border_color, rect, width=2, border_radius=10)
         display = key_name.upper() if key_name else "-"
-        text_surface = self.font_small.render(display, True, self.text_primary)
+        text_surface = self._render_cached(self.font_small, display, self.text_primary)
         text_rect = text_surface.get_rect(center=rect.center)
         self.screen.blit(text_surface, text_rect)
 
@@ -838,8 +1315,7 @@ class App:
                             self.selected_action_index = None
             elif event.button in (4, 5):
                 if self.action_table_rect.collidepoint(event.pos):
-                    delta = -1 if event.button == 4 else 1
-                    self.scroll_actions(delta)
+                    self._pending_wheel_delta += -1 if event.button == 4 else 1
         elif event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1:
                 self.action_scroll_dragging = False
@@ -848,12 +1324,19 @@ class App:
                 thumb_height = self.action_scrollbar_thumb_rect.height
                 track = self.action_scrollbar_track_rect
                 new_thumb_y = event.pos[1] - self.action_scroll_drag_offset
-                new_thumb_y = max(track.y, min(track.y + track.height - thumb_height, new_thumb_y))
-                self.set_scroll_offset_from_thumb_position(new_thumb_y)
+                self._pending_thumb_y = max(track.y, min(track.y + track.height - thumb_height, new_thumb_y))
         elif event.type == pygame.MOUSEWHEEL:
             mouse_pos = pygame.mouse.get_pos()
             if self.action_table_rect.collidepoint(mouse_pos):
-                self.scroll_actions(-event.y)
+                self._pending_wheel_delta += -event.y
+
+    def apply_pending_table_scroll(self) -> None:
+        if self._pending_thumb_y is not None:
+            self.set_scroll_offset_from_thumb_position(self._pending_thumb_y)
+            self._pending_thumb_y = None
+        if self._pending_wheel_delta:
+            self.scroll_actions(self._pending_wheel_delta)
+            self._pending_wheel_delta = 0
 
     def scroll_actions(self, delta: int) -> None:
         if len(self.actions) <= self.action_table_max_visible:
@@ -862,6 +1345,7 @@ class App:
         max_offset = len(self.actions) - self.action_table_max_visible
         new_offset = self.action_scroll_offset + delta
         self.action_scroll_offset = max(0, min(new_offset, max_offset))
+        self.invalidate_action_table()
 
     def set_scroll_offset_from_thumb_position(self, thumb_y: int) -> None:
         if not self.action_scrollbar_track_rect or not self.action_scrollbar_thumb_rect:
@@ -876,6 +1360,14 @@ class App:
         ratio = max(0.0, min(1.0, ratio))
         max_offset = max(0, len(self.actions) - self.action_table_max_visible)
         self.action_scroll_offset = int(round(ratio * max_offset))
+        self.invalidate_action_table()
+
+    def _reformat_action(self, action: ActionItem) -> Tuple[str, str, str]:
+        return (
+            self.format_action_display(action),
+            self.format_action_position(action),
+            self.format_action_delay(action),
+        )
 
     def format_action_display(self, action: ActionItem) -> str:
         label = action.action_type
@@ -935,7 +1427,7 @@ class App:
         if scope.startswith("Global"):
             self.register_global_hotkeys()
         else:
-            self.unregister_global_hotkeys()
+            self.register_focused_hotkeys()
             self.set_status("Hotkeys limited to app window.")
 
     def begin_hotkey_capture(self, kind: str) -> None:
@@ -954,17 +1446,50 @@ class App:
             self.hotkey_scope = "Focused (in app)"
             return
         try:
-            self.unregister_global_hotkeys()
-            handle_toggle = keyboard_module.add_hotkey(self.toggle_hotkey, lambda: self.hotkey_queue.put("toggle"))
-            handle_action = keyboard_module.add_hotkey(self.action_hotkey, lambda: self.hotkey_queue.put("action"))
-            self.global_hotkey_handles = [handle_toggle, handle_action]
+            self.install_hotkey_hooks()
             self.set_status("Global hotkeys enabled.")
         except Exception as exc:
-            self.global_hotkey_handles = []
+            self.unregister_global_hotkeys()
             self.set_status(f"Global hotkey error: {exc}")
             self.focus_dropdown.set_selected_by_value("Focused (in app)", invoke_callback=False)
             self.hotkey_scope = "Focused (in app)"
 
+    def register_focused_hotkeys(self) -> None:
+        if keyboard_module is None:
+            return
+        try:
+            self.install_hotkey_hooks()
+        except Exception:
+            self.unregister_global_hotkeys()
+
+    def install_hotkey_hooks(self) -> None:
+        self.unregister_global_hotkeys()
+        self.global_hotkey_handles.append(keyboard_module.add_hotkey(self.toggle_hotkey, self._on_toggle_hotkey, suppress=False))
+        self.global_hotkey_handles.append(keyboard_module.add_hotkey(self.action_hotkey, self._on_action_hotkey, suppress=False))
+
+    def _on_toggle_hotkey(self) -> None:
+        self._hotkey_deque.append("toggle")
+        self._wake_for_hotkeys()
+
+    def _on_action_hotkey(self) -> None:
+        self._hotkey_deque.append("action")
+        self._wake_for_hotkeys()
+
+    def _wake_for_hotkeys(self) -> None:
+        self._post_wake_event(self._hotkey_wake, HOTKEY_EVENT)
+
+    def _wake_for_state_change(self) -> None:
+        self._post_wake_event(self._state_wake, STATE_CHANGED_EVENT)
+
+    def _post_wake_event(self, wake_flag: threading.Event, event_type: int) -> None:
+        if wake_flag.is_set():
+            return
+        wake_flag.set()
+        try:
+            pygame.event.post(pygame.event.Event(event_type))
+        except pygame.error:
+            wake_flag.clear()
+
     def unregister_global_hotkeys(self) -> None:
         if keyboard_module is None:
             return
@@ -975,6 +1500,22 @@ class App:
                 continue
         self.global_hotkey_handles = []
 
+    def start_mouse_listener(self) -> None:
+        if pynput_mouse is None:
+            return
+        try:
+            self.mouse_listener = pynput_mouse.Listener(on_move=self._on_global_mouse_move)
+            self.mouse_listener.daemon = True
+            self.mouse_listener.start()
+        except Exception:
+            self.mouse_listener = None
+
+    def _on_global_mouse_move(self, x, y) -> None:
+        position = (int(x), int(y))
+        if position != self._last_global_xy:
+            self._last_global_xy = position
+            self._wake_for_state_change()
+
     def read_mouse_position(self) -> Tuple[int, int]:
         if pyautogui is not None:
             try:
@@ -1032,7 +1573,10 @@ class App:
             delay_ms = 0
         action = ActionItem(action_type=action_name, params=params, delay_ms=delay_ms)
         self.actions.append(action)
+        self._action_labels.append(self._reformat_action(action))
         self.selected_action_index = len(self.actions) - 1
+        self.invalidate_action_table()
+        self._rebuild_action_plan()
         self.set_status(f"Added action '{action_name}'.")
 
     def delete_action(self) -> None:
@@ -1044,6 +1588,9 @@ class App:
             self.set_status("Select an action to delete.")
             return
         removed = self.actions.pop(self.selected_action_index)
+        self._action_labels.pop(self.selected_action_index)
+        self.invalidate_action_table()
+        self._rebuild_action_plan()
         self.set_status(f"Removed action '{removed.action_type}'.")
         if self.actions:
             self.selected_action_index = min(self.selected_action_index, len(self.actions) - 1)
@@ -1071,18 +1618,17 @@ class App:
         try:
             if file_path.lower().endswith(".json"):
                 payload = {
-                    "actions": [action.to_dict() for action in self.actions],
+                    "actions": self.actions.to_dicts(),
                     "region": self.search_region,
                     "similarity": self.similarity_slider.get_value(),
                 }
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(payload, f, indent=2)
+                with open(file_path, "wb") as f:
+                    f.write(dump_json(payload, indent=True))
             else:
                 with open(file_path, "w", newline="", encoding="utf-8") as f:
                     writer = csv.writer(f)
                     writer.writerow(["action_type", "params", "delay_ms"])
-                    for action in self.actions:
-                        writer.writerow([action.action_type, json.dumps(action.params), action.delay_ms])
+                    writer.writerows([action_type, dump_json(params).decode("utf-8"), delay_ms] for action_type, params, delay_ms in self.actions.rows())
             self.set_status(f"Saved {len(self.actions)} actions.")
         except Exception as exc:
             self.set_status(f"Save failed: {exc}")
@@ -1105,32 +1651,43 @@ class App:
             self.set_status("Load cancelled.")
             return
         try:
-            loaded_actions: List[ActionItem] = []
+            loaded_actions = ActionTable()
+            loaded_region: Optional[Tuple[int, ...]] = None
+            loaded_similarity: Optional[int] = None
             if file_path.lower().endswith(".json"):
-                with open(file_path, "r", encoding="utf-8") as f:
-                    payload = json.load(f)
+                with open(file_path, "rb") as f:
+                    payload = load_json(f.read())
                 for item in payload.get("actions", []):
                     loaded_actions.append(ActionItem.from_dict(item))
                 region = payload.get("region")
                 if region and len(region) == 4:
-                    self.search_region = tuple(int(v) for v in region)
-                    self.region_message = self.format_region_message()
+                    loaded_region = tuple(int(v) for v in region)
                 similarity = payload.get("similarity")
                 if similarity is not None:
-                    self.similarity_slider.set_value(int(similarity))
+                    loaded_similarity = int(similarity)
             else:
                 with open(file_path, "r", encoding="utf-8") as f:
                     reader = csv.DictReader(f)
                     for row in reader:
                         params = row.get("params", "{}")
                         try:
-                            params_dict = json.loads(params)
+                            params_dict = load_json(params)
                         except json.JSONDecodeError:
                             params_dict = {}
                         delay_ms = parse_positive_int(row.get("delay_ms", "0")) or 0
                         loaded_actions.append(ActionItem(action_type=row.get("action_type", ""), params=params_dict, delay_ms=delay_ms))
+            loaded_labels = [self._reformat_action(action) for action in loaded_actions]
+            loaded_plan = self._compile_action_plan(loaded_actions)
             self.actions = loaded_actions
+            self._action_labels = loaded_labels
+            self._action_plan = loaded_plan
+            if loaded_region is not None:
+                self.search_region = loaded_region
+                self.region_message = self.format_region_message()
+            if loaded_similarity is not None:
+                self.similarity_slider.set_value(loaded_similarity)
             self.selected_action_index = None
+            self.invalidate_action_table()
             self.set_status(f"Loaded {len(self.actions)} actions from file.")
         except Exception as exc:
             self.set_status(f"Load failed: {exc}")
@@ -1143,25 +1700,69 @@ class App:
             else:
                 self.set_status("Clipboard does not contain an image.")
             return
-        self.set_target_image(image)
-
-    def set_target_image(self, image: "Image.Image") -> None:
-        pygame_image = pil_image_to_surface(image)
-        self.target_image_surface = pygame_image
-        self.target_image_preview = scale_surface_to_rect(pygame_image, self.target_image_rect)
-        if np is not None and cv2 is not None:
-            rgb_image = image.convert("RGB")
-            self.target_image_cv = cv2.cvtColor(np.array(rgb_image), cv2.COLOR_RGB2BGR)
-        else:
-            self.target_image_cv = None
-        self.set_status(f"Loaded image ({image.width}x{image.height}).")
+        self.enqueue_target_image(image)
+
+    def enqueue_target_image(self, image: "Image.Image") -> None:
+        self._target_image_token += 1
+        threading.Thread(target=self._prepare_target_image, args=(self._target_image_token, image), daemon=True).start()
+
+    def _prepare_target_image(self, token: int, image: "Image.Image") -> None:
+        prepared = PreparedTargetImage(token=token, size=image.size)
+        try:
+            prepared.surface = pil_image_to_surface(image, convert=False)
+            prepared.preview = scale_surface_to_rect(prepared.surface, self.target_image_rect, quality="fast", convert=False)
+            if np is not None and cv2 is not None:
+                rgb_image = image if image.mode == "RGB" else image.convert("RGB")
+                prepared.template = prepare_template_data(np.ascontiguousarray(np.asarray(rgb_image)[:, :, ::-1]))
+        except Exception as exc:
+            prepared.error = exc
+        self._prepared_images.put(prepared)
+        self._wake_for_state_change()
+
+    def apply_prepared_images(self) -> None:
+        while True:
+            try:
+                prepared = self._prepared_images.get_nowait()
+            except queue.Empty:
+                return
+            if prepared.token != self._target_image_token:
+                continue
+            if prepared.error is not None:
+                self.set_status(f"Image load failed: {prepared.error}")
+                continue
+            self.target_image_surface = convert_for_display(prepared.surface)
+            self.target_image_preview = convert_for_display(prepared.preview)
+            self._target_preview_key = (id(self.target_image_surface), self.target_image_rect.size)
+            self.set_template_data(prepared.template)
+            self.set_status(f"Loaded image ({prepared.size[0]}x{prepared.size[1]}).")
 
     def clear_target_image(self) -> None:
+        self._target_image_token += 1
         self.target_image_surface = None
-        self.target_image_preview = None
-        self.target_image_cv = None
+        self.refresh_target_preview()
+        self.set_template_data(None)
         self.set_status("Target image cleared.")
 
+    def set_template_data(self, template: Optional[Tuple[Any, Any, Optional[Any]]]) -> None:
+        self._template_data = template
+        if template is None:
+            self.target_image_cv = None
+            self.target_image_gray = None
+            self.target_image_small = None
+            return
+        self.target_image_cv, self.target_image_gray, self.target_image_small = template
+
+    def refresh_target_preview(self) -> None:
+        if self.target_image_surface is None:
+            self.target_image_preview = None
+            self._target_preview_key = None
+            return
+        key = (id(self.target_image_surface), self.target_image_rect.size)
+        if key == self._target_preview_key:
+            return
+        self._target_preview_key = key
+        self.target_image_preview = scale_surface_to_rect(self.target_image_surface, self.target_image_rect, quality="fast")
+
     def start_region_selection(self) -> None:
         if pynput_mouse is None:
             self.set_status("Install 'pynput' to enable region selection.")
@@ -1210,10 +1811,12 @@ class App:
             self.search_region = (left, top, width, height)
             self.set_status(f"Region set to ({left}, {top}) size {width}x{height}.")
         self.region_message = self.format_region_message()
+        self.invalidate_action_table()
 
     def use_full_screen(self) -> None:
         self.search_region = None
         self.region_message = "Use Full Screen"
+        self.invalidate_action_table()
         self.set_status("Search mode set to full screen.")
 
     def format_region_message(self) -> str:
@@ -1280,25 +1883,64 @@ class App:
             self.update_run_buttons()
 
     def perform_detection_cycle(self) -> Optional[Tuple[bool, Any]]:
-        if self.target_image_cv is None or pyautogui is None or cv2 is None or np is None:
+        template_data = self._template_data
+        if template_data is None or pyautogui is None or cv2 is None or np is None:
             return None
         screenshot, offset = self.capture_screen()
         if screenshot is None:
             return None
-        try:
-            result = cv2.matchTemplate(screenshot, self.target_image_cv, cv2.TM_CCOEFF_NORMED)
-            _, max_val, _, max_loc = cv2.minMaxLoc(result)
-        except Exception as exc:
-            self.set_status(f"Template match failed: {exc}")
-            return None
+        template_cv, template, _ = template_data
+        frame_key = (zlib.crc32(screenshot), screenshot.shape, offset)
+        last_match = getattr(self._capture_local, "last_match", None)
+        if last_match is not None and last_match[0] is template and last_match[1] == frame_key:
+            max_val, max_loc = last_match[2]
+        else:
+            try:
+                max_val, max_loc = self.match_template(screenshot, template_data)
+            except Exception as exc:
+                self.set_status(f"Template match failed: {exc}")
+                return None
+            self._capture_local.last_match = (template, frame_key, (max_val, max_loc))
         if max_val >= self.similarity_threshold:
-            h, w = self.target_image_cv.shape[:2]
+            h, w = template_cv.shape[:2]
             center_x = offset[0] + max_loc[0] + w // 2
             center_y = offset[1] + max_loc[1] + h // 2
             return True, ((center_x, center_y), max_val)
         return False, max_val
 
+    def match_template(self, screenshot: Any, template_data: Tuple[Any, Any, Optional[Any]]) -> Tuple[float, Tuple[int, int]]:
+        _, template, template_small = template_data
+        if screenshot.ndim == 3:
+            gray = self._scratch_buffer("frame_gray", screenshot.shape[:2], np.uint8)
+            cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY, dst=gray)
+            screenshot = gray
+        screen_h, screen_w = screenshot.shape[:2]
+        h, w = template.shape[:2]
+        factor = MATCH_PYRAMID_FACTOR
+        if template_small is None or screen_w < w * 2 or screen_h < h * 2:
+            result = self._scratch_buffer("match_result", (screen_h - h + 1, screen_w - w + 1), np.float32)
+            cv2.matchTemplate(screenshot, template, cv2.TM_CCOEFF_NORMED, result=result)
+            return match_peak(result)
+        small_w, small_h = screen_w // factor, screen_h // factor
+        screenshot_small = self._scratch_buffer("screen_small", (small_h, small_w), np.uint8)
+        cv2.resize(screenshot, (small_w, small_h), dst=screenshot_small, interpolation=cv2.INTER_AREA)
+        small_th, small_tw = template_small.shape[:2]
+        coarse = self._scratch_buffer("coarse_result", (small_h - small_th + 1, small_w - small_tw + 1), np.float32)
+        cv2.matchTemplate(screenshot_small, template_small, cv2.TM_CCOEFF_NORMED, result=coarse)
+        _, coarse_loc = match_peak(coarse)
+        margin = factor * 2
+        left = max(0, coarse_loc[0] * factor - margin)
+        top = max(0, coarse_loc[1] * factor - margin)
+        right = min(screen_w, coarse_loc[0] * factor + w + margin)
+        bottom = min(screen_h, coarse_loc[1] * factor + h + margin)
+        result = self._scratch_buffer("refine_result", (bottom - top - h + 1, right - left - w + 1), np.float32)
+        cv2.matchTemplate(screenshot[top:bottom, left:right], template, cv2.TM_CCOEFF_NORMED, result=result)
+        max_val, max_loc = match_peak(result)
+        return max_val, (left + max_loc[0], top + max_loc[1])
+
     def capture_screen(self) -> Tuple[Optional[Any], Tuple[int, int]]:
+        if mss is not None and np is not None and cv2 is not None:
+            return self._capture_screen_mss()
         if pyautogui is None:
             return None, (0, 0)
         try:
@@ -1314,79 +1956,105 @@ class App:
             return None, (0, 0)
         if np is None or cv2 is None:
             return None, offset
-        frame = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+        frame = cv2.cvtColor(np.asarray(screenshot), cv2.COLOR_RGB2GRAY)
         return frame, offset
 
+    def _capture_screen_mss(self) -> Tuple[Optional[Any], Tuple[int, int]]:
+        grabber = getattr(self._capture_local, "grabber", None)
+        try:
+            if grabber is None:
+                grabber = mss.mss()
+                self._capture_local.grabber = grabber
+            if self.search_region:
+                x, y, w, h = self.search_region
+                monitor = {"left": x, "top": y, "width": w, "height": h}
+            else:
+                monitor = grabber.monitors[1]
+            shot = grabber.grab(monitor)
+        except Exception as exc:
+            self.set_status(f"Screenshot error: {exc}")
+            return None, (0, 0)
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        frame = self._scratch_buffer("frame", (shot.height, shot.width), np.uint8)
+        cv2.cvtColor(bgra, cv2.COLOR_BGRA2GRAY, dst=frame)
+        return frame, (monitor["left"], monitor["top"])
+
+    def _scratch_buffer(self, name: str, shape: Tuple[int, ...], dtype: Any) -> Any:
+        buffer = getattr(self._capture_local, name, None)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=dtype)
+            setattr(self._capture_local, name, buffer)
+        return buffer
+
     def execute_actions(self, match_center: Tuple[int, int], stop_signal: Optional[threading.Event] = None) -> None:
         if pyautogui is None:
             self.set_status("pyautogui is required to run actions.")
             return
         stop_flag = stop_signal or threading.Event()
-        for action in self.actions:
+        for action_type, run_action, delay_seconds in self._action_plan:
             if stop_flag.is_set():
                 break
             try:
-                if action.action_type == "Wait":
-                    duration = action.params.get("duration_ms", action.delay_ms)
-                    if duration > 0:
-                        end_time = time.time() + duration / 1000.0
-                        while time.time() < end_time:
-                            if stop_flag.is_set():
-                                break
-                            time.sleep(0.01)
-                    continue
-                self.perform_action(action, match_center)
-                if action.delay_ms > 0:
-                    end_time = time.time() + action.delay_ms / 1000.0
-                    while time.time() < end_time:
-                        if stop_flag.is_set():
-                            break
-                        time.sleep(0.01)
+                if run_action(match_center, stop_flag):
+                    break
+                if delay_seconds > 0 and self._interruptible_sleep(delay_seconds, stop_flag):
+                    break
             except Exception as exc:
-                self.set_status(f"Action '{action.action_type}' failed: {exc}")
+                self.set_status(f"Action '{action_type}' failed: {exc}")
                 break
 
-    def perform_action(self, action: ActionItem, match_center: Tuple[int, int]) -> None:
-        params = action.params or {}
+    def _interruptible_sleep(self, seconds: float, stop_flag: threading.Event) -> bool:
+        return stop_flag.wait(seconds)
+
+    def _rebuild_action_plan(self) -> None:
+        self._action_plan = self._compile_action_plan(self.actions)
+
+    def _compile_action_plan(self, actions: ActionTable) -> List[Tuple[str, CompiledAction, float]]:
+        plan: List[Tuple[str, CompiledAction, float]] = []
+        for action_type, params, delay_ms in actions.rows():
+            delay_seconds = 0.0 if action_type == "Wait" else delay_ms / 1000.0
+            plan.append((action_type, self._compile_action(action_type, params, delay_ms), delay_seconds))
+        return plan
+
+    def _compile_action(self, action_type: str, params: Dict[str, Any], delay_ms: int) -> CompiledAction:
+        params = params or {}
         x = params.get("x")
         y = params.get("y")
-        if isinstance(x, str):
-            x = parse_int(x)
-        if isinstance(y, str):
-            y = parse_int(y)
-        if action.action_type == "Move to Match":
-            pyautogui.moveTo(match_center[0], match_center[1])
-        elif action.action_type == "Move to Position":
-            if x is None or y is None:
-                raise ValueError("Move to Position requires coordinates.")
-            pyautogui.moveTo(x, y)
-        elif action.action_type == "Left Click":
-            if x is not None and y is not None:
-                pyautogui.click(x, y, button="left")
-            else:
-                pyautogui.click(match_center[0], match_center[1], button="left")
-        elif action.action_type == "Right Click":
-            if x is not None and y is not None:
-                pyautogui.click(x, y, button="right")
-            else:
-                pyautogui.click(match_center[0], match_center[1], button="right")
-        elif action.action_type == "Double Click":
-            if x is not None and y is not None:
-                pyautogui.doubleClick(x, y)
-            else:
-                pyautogui.doubleClick(match_center[0], match_center[1])
-        elif action.action_type == "Type Text":
+        has_position = x is not None and y is not None
+        if action_type == "Wait":
+            duration_ms = params.get("duration_ms")
+            seconds = (delay_ms if duration_ms is None else int(duration_ms)) / 1000.0
+            return lambda match_center, stop_flag: seconds > 0 and self._interruptible_sleep(seconds, stop_flag)
+        if action_type == "Move to Match":
+            return lambda match_center, stop_flag: pyautogui.moveTo(match_center[0], match_center[1])
+        if action_type == "Move to Position":
+            if not has_position:
+                def missing_position(match_center: Tuple[int, int], stop_flag: threading.Event) -> None:
+                    raise ValueError("Move to Position requires coordinates.")
+                return missing_position
+            return lambda match_center, stop_flag: pyautogui.moveTo(x, y)
+        if action_type in ("Left Click", "Right Click"):
+            button = "left" if action_type == "Left Click" else "right"
+            if has_position:
+                return lambda match_center, stop_flag: pyautogui.click(x, y, button=button)
+            return lambda match_center, stop_flag: pyautogui.click(match_center[0], match_center[1], button=button)
+        if action_type == "Double Click":
+            if has_position:
+                return lambda match_center, stop_flag: pyautogui.doubleClick(x, y)
+            return lambda match_center, stop_flag: pyautogui.doubleClick(match_center[0], match_center[1])
+        if action_type == "Type Text":
             text = params.get("text", "")
-            if text:
-                pyautogui.write(text, interval=0.02)
-        elif action.action_type == "Press Key":
+            if not text:
+                return lambda match_center, stop_flag: None
+            return lambda match_center, stop_flag: pyautogui.write(text, interval=0.02)
+        if action_type == "Press Key":
             sequence = parse_hotkey_sequence(params.get("text", ""))
             if not sequence:
-                return
+                return lambda match_center, stop_flag: None
             if len(sequence) == 1:
-                pyautogui.press(sequence[0])
-            else:
-                pyautogui.hotkey(*sequence)
+                return lambda match_center, stop_flag: pyautogui.press(sequence[0])
+            return lambda match_center, stop_flag: pyautogui.hotkey(*sequence)
+        return lambda match_center, stop_flag: None
 
     def toggle_run_from_hotkey(self) -> None:
         if self.automation_running:
@@ -1398,7 +2066,17 @@ class App:
         if self.automation_running:
             self.set_status("Stop automation before running manual action.")
             return
-        threading.Thread(target=self.run_detection_once, daemon=True).start()
+        if self._detection_worker is None:
+            self._detection_worker = threading.Thread(target=self._detection_worker_loop, daemon=True)
+            self._detection_worker.start()
+        self._detection_jobs.put(self.run_detection_once)
+
+    def _detection_worker_loop(self) -> None:
+        while True:
+            job = self._detection_jobs.get()
+            if job is None or self._shutdown_event.is_set():
+                return
+            job()
 
     def run_detection_once(self) -> None:
         result = self.perform_detection_cycle()
@@ -1409,15 +2087,32 @@ class App:
         if matched:
             center, score = data
             self.set_status(f"Match {score * 100:.1f}% at {center[0]}, {center[1]}")
-            self.execute_actions(center)
+            self.execute_actions(center, self._shutdown_event)
         else:
             score = data
             self.set_status(f"No match ({score * 100:.1f}%).")
 
     def set_status(self, message: str) -> None:
+        self._status_queue.put_nowait(message)
+        self._wake_for_state_change()
+
+    def apply_status_updates(self) -> None:
+        message = None
+        while True:
+            try:
+                message = self._status_queue.get_nowait()
+            except queue.Empty:
+                break
+        if message is None or message == self.status_message:
+            return
+        _wrap_and_render.cache_clear()
         self.status_message = message
 
     def update_run_buttons(self) -> None:
+        run_state = (self.automation_running, self.region_setting_in_progress)
+        if run_state == self._run_button_state:
+            return
+        self._run_button_state = run_state
         self.start_button.set_disabled(self.automation_running)
         self.stop_button.set_disabled(not self.automation_running)
         self.set_region_button.set_disabled(self.region_setting_in_progress)
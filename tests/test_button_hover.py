@@ -0,0 +1,38 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+import auto_mouse_keyboard_finder_v5_actions_ui_perfect as finder
+
+
+class ButtonHoverTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = finder.App()
+        self.app.handle_events()
+        self.button = self.app.buttons[0]
+
+    def tearDown(self) -> None:
+        self.app.shutdown()
+
+    def post_and_handle(self, event: pygame.event.Event) -> None:
+        self.assertTrue(pygame.event.post(event), f"{pygame.event.event_name(event.type)} is blocked")
+        self.app.handle_events()
+
+    def test_motion_over_button_sets_hover(self) -> None:
+        self.post_and_handle(pygame.event.Event(pygame.MOUSEMOTION, pos=self.button.rect.center, rel=(0, 0), buttons=(0, 0, 0)))
+        self.assertTrue(self.button.hovered)
+
+    def test_window_leave_clears_hover(self) -> None:
+        self.post_and_handle(pygame.event.Event(pygame.MOUSEMOTION, pos=self.button.rect.center, rel=(0, 0), buttons=(0, 0, 0)))
+        self.post_and_handle(pygame.event.Event(pygame.WINDOWLEAVE))
+        self.assertFalse(self.button.hovered)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,67 @@
 import pygame
-from typing import Optional, Tuple, List
+import pygame.freetype
+from typing import Optional, Tuple, List, Dict, Union
+
+BlitPair = Tuple[pygame.Surface, Tuple[int, int]]
+TextCache = Dict[Tuple[str, Tuple[int, int, int]], pygame.Surface]
+AnyFont = Union[pygame.font.Font, pygame.freetype.Font]
+TEXT_CACHE_LIMIT = 64
+_ASCII_DIGITS = bytes(1 if chr(i).isdigit() else 0 for i in range(128))
+
+def blit_batch(surface: pygame.Surface, pairs: List[BlitPair]) -> None:
+    if not pairs:
+        return
+    if hasattr(surface, "fblits"):
+        surface.fblits(pairs)
+    else:
+        surface.blits(pairs, doreturn=False)
+
+def render_text_cached(cache: TextCache, font: AnyFont, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    key = (text, color)
+    surface = cache.get(key)
+    if surface is None:
+        if len(cache) >= TEXT_CACHE_LIMIT:
+            cache.clear()
+        if isinstance(font, pygame.freetype.Font):
+            surface = font.render(text, color)[0].convert_alpha()
+        else:
+            surface = font.render(text, True, color).convert_alpha()
+        cache[key] = surface
+    return surface
+
+_COLOR_SCALE_LUTS: Dict[float, Tuple[int, ...]] = {}
+
+def _scale_color(color: Tuple[int, int, int], factor: float) -> Tuple[int, int, int]:
+    lut = _COLOR_SCALE_LUTS.get(factor)
+    if lut is None:
+        lut = tuple(min(255, max(0, int(c * factor))) for c in range(256))
+        _COLOR_SCALE_LUTS[factor] = lut
+    red, green, blue = color
+    return (lut[red], lut[green], lut[blue])
 
 def lighten_color(color: Tuple[int, int, int], factor: float = 1.12) -> Tuple[int, int, int]:
-    return tuple(min(255, max(0, int(c * factor))) for c in color)
+    return _scale_color(color, factor)
 
 def darken_color(color: Tuple[int, int, int], factor: float = 0.85) -> Tuple[int, int, int]:
-    return tuple(min(255, max(0, int(c * factor))) for c in color)
+    return _scale_color(color, factor)
 
 class Button:
+    __slots__ = (
+        "rect",
+        "text",
+        "callback",
+        "font",
+        "bg_color",
+        "hover_color",
+        "disabled_color",
+        "text_color",
+        "disabled",
+        "hovered",
+        "_surface_cache",
+        "_blits",
+        "_text_cache",
+    )
+
     def __init__(
         self,
         rect: Tuple[int, int, int, int],
@@ -24,38 +78,113 @@ class Button:
         self.font = font
         self.bg_color = bg_color
         self.hover_color = hover_color or lighten_color(bg_color, 1.15)
+        self.disabled_color = darken_color(bg_color, 0.6)
         self.text_color = text_color
         self.disabled = False
+        self.hovered = False
+        self._surface_cache: Dict[str, pygame.Surface] = {}
+        self._blits: Optional[List[BlitPair]] = None
+        self._text_cache: TextCache = {}
 
     def draw(self, surface: pygame.Surface) -> None:
-        color = self.bg_color
-        if self.disabled:
-            color = darken_color(color, 0.6)
-        elif self.rect.collidepoint(pygame.mouse.get_pos()):
+        if not self.rect.colliderect(surface.get_clip()):
+            return
+        blit_batch(surface, self.get_blits())
+
+    def prerender(self) -> None:
+        for state in ("normal", "hover", "disabled"):
+            self._get_state_surface(state)
+
+    def get_blits(self) -> List[BlitPair]:
+        if self._blits is None:
+            if self.disabled:
+                state = "disabled"
+            elif self.hovered:
+                state = "hover"
+            else:
+                state = "normal"
+            self._blits = [(self._get_state_surface(state), self.rect.topleft)]
+        return self._blits
+
+    def _get_state_surface(self, state: str) -> pygame.Surface:
+        cached = self._surface_cache.get(state)
+        if cached is not None:
+            return cached
+        if state == "disabled":
+            color = self.disabled_color
+        elif state == "hover":
             color = self.hover_color
-        pygame.draw.rect(surface, color, self.rect, border_radius=12)
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        else:
+            color = self.bg_color
+        widget_surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local_rect = widget_surface.get_rect()
+        pygame.draw.rect(widget_surface, color, local_rect, border_radius=12)
+        text_surface = render_text_cached(self._text_cache, self.font, self.text, self.text_color)
+        widget_surface.blit(text_surface, text_surface.get_rect(center=local_rect.center))
+        cached = widget_surface.convert_alpha()
+        self._surface_cache[state] = cached
+        return cached
 
     def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.MOUSEMOTION:
+            self._set_hovered(self.rect.collidepoint(event.pos))
+            return
+        if event.type == pygame.WINDOWLEAVE:
+            self._set_hovered(False)
+            return
         if self.disabled:
             return
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(event.pos):
                 self.callback()
 
+    def _set_hovered(self, value: bool) -> None:
+        if value != self.hovered:
+            self.hovered = value
+            self._blits = None
+
     def set_disabled(self, value: bool) -> None:
-        self.disabled = value
+        if value != self.disabled:
+            self.disabled = value
+            self._blits = None
 
     def set_text(self, text: str) -> None:
+        if text == self.text:
+            return
+        self._text_cache.clear()
         self.text = text
+        self._surface_cache.clear()
+        self._blits = None
+        self.prerender()
 
 class TextInput:
+    __slots__ = (
+        "rect",
+        "font",
+        "text",
+        "placeholder",
+        "numeric",
+        "allow_negative",
+        "active",
+        "disabled",
+        "bg_color",
+        "text_color",
+        "placeholder_color",
+        "border_color_active",
+        "border_color_inactive",
+        "disabled_bg_color",
+        "disabled_border_color",
+        "max_length",
+        "_surface",
+        "_surface_key",
+        "_bg_cache",
+        "_text_cache",
+    )
+
     def __init__(
         self,
         rect: Tuple[int, int, int, int],
-        font: pygame.font.Font,
+        font: AnyFont,
         text: str = "",
         placeholder: str = "",
         numeric: bool = False,
@@ -74,22 +203,66 @@ class TextInput:
         self.placeholder_color = (125, 134, 160)
         self.border_color_active = (96, 120, 200)
         self.border_color_inactive = (60, 70, 110)
+        self.disabled_bg_color = darken_color(self.bg_color, 0.8)
+        self.disabled_border_color = darken_color(self.border_color_inactive, 0.7)
         self.max_length: Optional[int] = None
+        self._surface: Optional[pygame.Surface] = None
+        self._surface_key: Optional[Tuple[str, str, bool, bool]] = None
+        self._bg_cache: Dict[str, pygame.Surface] = {}
+        self._text_cache: TextCache = {}
+        render_text_cached(self._text_cache, self.font, self.placeholder, self.placeholder_color)
 
     def draw(self, surface: pygame.Surface) -> None:
-        color = self.bg_color if not self.disabled else darken_color(self.bg_color, 0.8)
-        border_color = self.border_color_active if self.active else self.border_color_inactive
+        if not self.rect.colliderect(surface.get_clip()):
+            return
+        blit_batch(surface, self.get_blits())
+
+    def get_blits(self) -> List[BlitPair]:
+        key = (self.text, self.placeholder, self.active, self.disabled)
+        if self._surface is None or key != self._surface_key:
+            self._surface = self._render_surface()
+            self._surface_key = key
+        return [(self._surface, self.rect.topleft)]
+
+    def _get_background(self) -> pygame.Surface:
         if self.disabled:
-            border_color = darken_color(border_color, 0.7)
-        pygame.draw.rect(surface, color, self.rect, border_radius=10)
-        pygame.draw.rect(surface, border_color, self.rect, width=2, border_radius=10)
+            state = "disabled"
+        elif self.active:
+            state = "active"
+        else:
+            state = "normal"
+        cached = self._bg_cache.get(state)
+        if cached is not None:
+            return cached
+        if state == "disabled":
+            color = self.disabled_bg_color
+            border_color = self.disabled_border_color
+        else:
+            color = self.bg_color
+            border_color = self.border_color_active if state == "active" else self.border_color_inactive
+        cached = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local_rect = cached.get_rect()
+        pygame.draw.rect(cached, color, local_rect, border_radius=10)
+        pygame.draw.rect(cached, border_color, local_rect, width=2, border_radius=10)
+        self._bg_cache[state] = cached
+        return cached
+
+    def _render_surface(self) -> pygame.Surface:
+        widget_surface = self._get_background().copy()
+        local_rect = widget_surface.get_rect()
         display_text = self.text
+        if display_text and isinstance(self.font, pygame.freetype.Font):
+            text_rect = self.font.get_rect(display_text)
+            text_rect.midleft = (10, local_rect.centery)
+            self.font.render_to(widget_surface, text_rect, display_text, self.text_color)
+            return widget_surface.convert_alpha()
         if not display_text and not self.active:
-            text_surface = self.font.render(self.placeholder, True, self.placeholder_color)
+            text_surface = render_text_cached(self._text_cache, self.font, self.placeholder, self.placeholder_color)
         else:
-            text_surface = self.font.render(display_text, True, self.text_color)
-        text_rect = text_surface.get_rect(midleft=(self.rect.x + 10, self.rect.centery))
-        surface.blit(text_surface, text_rect)
+            text_surface = render_text_cached(self._text_cache, self.font, display_text, self.text_color)
+        text_rect = text_surface.get_rect(midleft=(10, local_rect.centery))
+        widget_surface.blit(text_surface, text_rect)
+        return widget_surface.convert_alpha()
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if self.disabled:
@@ -103,9 +276,10 @@ class TextInput:
                 self.text = self.text[:-1]
             else:
                 if self.numeric:
-                    if event.unicode.isdigit():
-                        self.text += event.unicode
-                    elif event.unicode == "-" and self.allow_negative and "-" not in self.text and len(self.text) == 0:
+                    char = event.unicode
+                    if len(char) == 1 and ord(char) < 128 and _ASCII_DIGITS[ord(char)]:
+                        self.text += char
+                    elif char == "-" and self.allow_negative and not self.text:
                         self.text += "-"
                 else:
                     if event.unicode and event.unicode != "\r":
@@ -119,6 +293,7 @@ class TextInput:
         self.text = value
 
     def set_placeholder(self, value: str) -> None:
+        self._text_cache.pop((self.placeholder, self.placeholder_color), None)
         self.placeholder = value
 
     def clear(self) -> None:
@@ -130,24 +305,46 @@ class TextInput:
             self.active = False
 
 class Slider:
+    __slots__ = (
+        "rect",
+        "min_value",
+        "max_value",
+        "value",
+        "dragging",
+        "changed",
+        "track_color",
+        "fill_color",
+        "handle_color",
+        "handle_radius",
+        "_track_rect",
+        "_fill_rect",
+    )
+
     def __init__(self, rect: Tuple[int, int, int, int], min_value: int, max_value: int, value: int) -> None:
         self.rect = pygame.Rect(rect)
         self.min_value = min_value
         self.max_value = max_value
         self.value = max(self.min_value, min(self.max_value, value))
         self.dragging = False
+        self.changed = True
         self.track_color = (58, 68, 104)
         self.fill_color = (92, 130, 255)
         self.handle_color = (220, 228, 255)
         self.handle_radius = 10
+        self._track_rect = pygame.Rect(self.rect.x, self.rect.y + self.rect.height // 2 - 3, self.rect.width, 6)
+        self._fill_rect = self._track_rect.copy()
 
     def draw(self, surface: pygame.Surface) -> None:
-        track_rect = pygame.Rect(self.rect.x, self.rect.y + self.rect.height // 2 - 3, self.rect.width, 6)
+        if not self.rect.colliderect(surface.get_clip()):
+            return
+        track_rect = self._track_rect
         pygame.draw.rect(surface, self.track_color, track_rect, border_radius=4)
-        ratio = (self.value - self.min_value) / (self.max_value - self.min_value)
-        fill_rect = pygame.Rect(track_rect.x, track_rect.y, int(track_rect.width * ratio), track_rect.height)
+        span = self.max_value - self.min_value
+        fill_px = (self.value - self.min_value) * track_rect.width // span if span else 0
+        fill_rect = self._fill_rect
+        fill_rect.width = fill_px
         pygame.draw.rect(surface, self.fill_color, fill_rect, border_radius=4)
-        handle_x = track_rect.x + int(track_rect.width * ratio)
+        handle_x = track_rect.x + fill_px
         handle_y = track_rect.centery
         pygame.draw.circle(surface, self.handle_color, (handle_x, handle_y), self.handle_radius)
 
@@ -162,17 +359,41 @@ class Slider:
             self._set_value_from_position(event.pos[0])
 
     def _set_value_from_position(self, x_pos: int) -> None:
-        ratio = (x_pos - self.rect.x) / max(1, self.rect.width)
-        ratio = max(0.0, min(1.0, ratio))
-        self.value = int(self.min_value + ratio * (self.max_value - self.min_value))
+        width = max(1, self.rect.width)
+        offset = max(0, min(width, x_pos - self.rect.x))
+        self._store_value(self.min_value + offset * (self.max_value - self.min_value) // width)
 
     def get_value(self) -> int:
         return self.value
 
     def set_value(self, value: int) -> None:
-        self.value = max(self.min_value, min(self.max_value, value))
+        self._store_value(max(self.min_value, min(self.max_value, value)))
+
+    def _store_value(self, value: int) -> None:
+        if value != self.value:
+            self.value = value
+            self.changed = True
 
 class Dropdown:
+    __slots__ = (
+        "rect",
+        "font",
+        "options",
+        "selected_index",
+        "on_change",
+        "expanded",
+        "bg_color",
+        "border_color",
+        "text_color",
+        "arrow_color",
+        "disabled",
+        "_header_surface",
+        "_header_key",
+        "_options_surface",
+        "_header_background",
+        "_text_cache",
+    )
+
     def __init__(
         self,
         rect: Tuple[int, int, int, int],
@@ -192,27 +413,66 @@ class Dropdown:
         self.text_color = (230, 235, 248)
         self.arrow_color = (140, 150, 180)
         self.disabled = False
+        self._header_surface: Optional[pygame.Surface] = None
+        self._header_key: Optional[str] = None
+        self._options_surface: Optional[pygame.Surface] = None
+        self._header_background: Optional[pygame.Surface] = None
+        self._text_cache: TextCache = {}
 
     def draw(self, surface: pygame.Surface) -> None:
-        pygame.draw.rect(surface, self.bg_color, self.rect, border_radius=10)
-        pygame.draw.rect(surface, self.border_color, self.rect, width=2, border_radius=10)
+        if not self.get_draw_rect().colliderect(surface.get_clip()):
+            return
+        blit_batch(surface, self.get_blits())
+
+    def get_draw_rect(self) -> pygame.Rect:
+        if self.expanded and self.options:
+            return self.rect.union(self.rect.move(0, self.rect.height * len(self.options)))
+        return self.rect
+
+    def get_blits(self) -> List[BlitPair]:
         text = self.get_selected() if self.options else ""
-        text_surface = self.font.render(text, True, self.text_color)
-        surface.blit(text_surface, (self.rect.x + 10, self.rect.y + (self.rect.height - text_surface.get_height()) // 2))
+        if self._header_surface is None or text != self._header_key:
+            self._header_surface = self._render_header(text)
+            self._header_key = text
+        pairs = [(self._header_surface, self.rect.topleft)]
+        if self.expanded and self.options:
+            if self._options_surface is None:
+                self._options_surface = self._render_options()
+            pairs.append((self._options_surface, self.rect.bottomleft))
+        return pairs
+
+    def _get_header_background(self) -> pygame.Surface:
+        if self._header_background is None:
+            background = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            local_rect = background.get_rect()
+            pygame.draw.rect(background, self.bg_color, local_rect, border_radius=10)
+            pygame.draw.rect(background, self.border_color, local_rect, width=2, border_radius=10)
+            self._header_background = background
+        return self._header_background
+
+    def _render_header(self, text: str) -> pygame.Surface:
+        header_surface = self._get_header_background().copy()
+        local_rect = header_surface.get_rect()
+        text_surface = render_text_cached(self._text_cache, self.font, text, self.text_color)
+        header_surface.blit(text_surface, (10, (local_rect.height - text_surface.get_height()) // 2))
         arrow_points = [
-            (self.rect.right - 18, self.rect.y + self.rect.height // 2 - 4),
-            (self.rect.right - 8, self.rect.y + self.rect.height // 2 - 4),
-            (self.rect.right - 13, self.rect.y + self.rect.height // 2 + 4),
+            (local_rect.right - 18, local_rect.height // 2 - 4),
+            (local_rect.right - 8, local_rect.height // 2 - 4),
+            (local_rect.right - 13, local_rect.height // 2 + 4),
         ]
-        pygame.draw.polygon(surface, self.arrow_color, arrow_points)
-        if self.expanded:
-            option_height = self.rect.height
-            for idx, option in enumerate(self.options):
-                option_rect = pygame.Rect(self.rect.x, self.rect.y + (idx + 1) * option_height, self.rect.width, option_height)
-                pygame.draw.rect(surface, self.bg_color, option_rect)
-                pygame.draw.rect(surface, self.border_color, option_rect, width=1)
-                option_surface = self.font.render(option, True, self.text_color)
-                surface.blit(option_surface, (option_rect.x + 10, option_rect.y + (option_rect.height - option_surface.get_height()) // 2))
+        pygame.draw.polygon(header_surface, self.arrow_color, arrow_points)
+        return header_surface.convert_alpha()
+
+    def _render_options(self) -> pygame.Surface:
+        option_height = self.rect.height
+        options_surface = pygame.Surface((self.rect.width, option_height * len(self.options)))
+        for idx, option in enumerate(self.options):
+            option_rect = pygame.Rect(0, idx * option_height, self.rect.width, option_height)
+            pygame.draw.rect(options_surface, self.bg_color, option_rect)
+            pygame.draw.rect(options_surface, self.border_color, option_rect, width=1)
+            option_surface = render_text_cached(self._text_cache, self.font, option, self.text_color)
+            options_surface.blit(option_surface, (option_rect.x + 10, option_rect.y + (option_rect.height - option_surface.get_height()) // 2))
+        return options_surface.convert()
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         if self.disabled:
@@ -238,12 +498,11 @@ class Dropdown:
         return handled
 
     def _option_at(self, pos: Tuple[int, int]) -> Optional[int]:
-        option_height = self.rect.height
-        for idx in range(len(self.options)):
-            option_rect = pygame.Rect(self.rect.x, self.rect.y + (idx + 1) * option_height, self.rect.width, option_height)
-            if option_rect.collidepoint(pos):
-                return idx
-        return None
+        x, y = pos
+        if not self.rect.x <= x < self.rect.right:
+            return None
+        row = (y - self.rect.y) // self.rect.height - 1
+        return row if 0 <= row < len(self.options) else None
 
     def get_selected(self) -> str:
         if not self.options: